@@ -1,10 +1,76 @@
+import time
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime
-from utils.github_api import get_paginated_data
+from utils.github_api import iter_paginated_data, DATA_CACHE_TTL, DATA_CACHE_MAX_ENTRIES
+from utils.quota import mark_loaded
+from utils.data_processing import build_dataframe_from_pages, filter_dataframe_by_date_range, weekly_commit_counts
 
-def display_commits(full_repo, token, start_date, end_date):
+COMMIT_COLUMNS = {"date": "datetime64[ns]", "author": "category"}
+
+def _commit_row(commit):
+    """
+    Reduce a raw commit to a row
+    
+    Args:
+        commit: Commit data from GitHub API
+        
+    Returns:
+        Dictionary with date and author, or None if the commit has no date
+    """
+    if "commit" in commit and "author" in commit["commit"] and "date" in commit["commit"]["author"]:
+        date_str = commit["commit"]["author"]["date"]
+        commit_date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
+        author = commit["commit"]["author"]["name"] if "name" in commit["commit"]["author"] else "Unknown"
+        return {"date": commit_date, "author": author}
+    
+    return None
+
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=DATA_CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_commits(full_repo, token, max_pages):
+    """
+    Load the commit history of a repository, cached per repository
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        DataFrame of commit dates and authors
+    """
+    commits_url = f"https://api.github.com/repos/{full_repo}/commits"
+    pages = iter_paginated_data(commits_url, token, max_pages)
+    
+    # Reduce each commit to the needed columns as its page arrives
+    commits_df = build_dataframe_from_pages(pages, _commit_row, COMMIT_COLUMNS)
+    
+    if commits_df.attrs["truncated"]:
+        st.warning("Commit history reached the memory limit, showing only the most recent commits")
+    
+    commits_df.attrs["fetched_at"] = time.time()
+    
+    return commits_df
+
+def load_commits(full_repo, token, max_pages=10):
+    """
+    Load the commit history of a repository and record the load for the quota planner
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        DataFrame of commit dates and authors
+    """
+    commits_df = _fetch_commits(full_repo, token, max_pages)
+    mark_loaded("commits", full_repo, token, max_pages, commits_df.attrs["fetched_at"])
+    
+    return commits_df
+
+def display_commits(full_repo, token, start_date, end_date, max_pages=10):
     """
     Display commit analysis
     
@@ -13,70 +79,47 @@ def display_commits(full_repo, token, start_date, end_date):
         token: GitHub personal access token
         start_date: Start date for filtering
         end_date: End date for filtering
+        max_pages: Maximum number of pages to fetch
         
     Returns:
         DataFrame of commit data
     """
-    commits_url = f"https://api.github.com/repos/{full_repo}/commits"
-    commits_data = get_paginated_data(commits_url, token)
+    commits_df = load_commits(full_repo, token, max_pages)
+    
+    # Filter by date range
+    commits_df = filter_dataframe_by_date_range(commits_df, "date", start_date, end_date)
     
-    if commits_data:
-        # Parse commit dates
-        commit_dates = []
-        commit_authors = []
+    if not commits_df.empty:
+        # Commits over time
+        st.subheader("Commit Activity")
+        
+        # Group commits by week
+        weekly_commits = weekly_commit_counts(commits_df)
+        weekly_commits = weekly_commits.tail(52)  # Last 52 weeks
+        
+        fig_commits = px.line(
+            weekly_commits, 
+            x="yearweek", 
+            y="commits",
+            labels={"yearweek": "Week", "commits": "Number of Commits"},
+            title="Weekly Commit Activity"
+        )
+        st.plotly_chart(fig_commits, use_container_width=True)
         
-        for commit in commits_data:
-            if "commit" in commit and "author" in commit["commit"] and "date" in commit["commit"]["author"]:
-                date_str = commit["commit"]["author"]["date"]
-                commit_date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-                
-                # Filter by date range
-                if start_date <= commit_date.date() <= end_date:
-                    commit_dates.append(commit_date)
-                    author = commit["commit"]["author"]["name"] if "name" in commit["commit"]["author"] else "Unknown"
-                    commit_authors.append(author)
+        # Top committers
+        st.subheader("Top Committers")
+        top_committers = commits_df['author'].value_counts().head(10).reset_index()
+        top_committers.columns = ['author', 'commits']
         
-        # Create commits dataframe
-        commits_df = pd.DataFrame({
-            'date': commit_dates,
-            'author': commit_authors
-        })
+        fig_committers = px.bar(
+            top_committers,
+            x="author",
+            y="commits",
+            labels={"author": "Committer", "commits": "Number of Commits"},
+            title="Top 10 Committers"
+        )
+        st.plotly_chart(fig_committers, use_container_width=True)
         
-        if not commits_df.empty:
-            # Commits over time
-            st.subheader("Commit Activity")
-            
-            # Group commits by week
-            commits_df['week'] = commits_df['date'].dt.isocalendar().week
-            commits_df['year'] = commits_df['date'].dt.year
-            commits_df['yearweek'] = commits_df['year'].astype(str) + "-" + commits_df['week'].astype(str).str.zfill(2)
-            
-            weekly_commits = commits_df.groupby('yearweek').size().reset_index(name='commits')
-            weekly_commits = weekly_commits.tail(52)  # Last 52 weeks
-            
-            fig_commits = px.line(
-                weekly_commits, 
-                x="yearweek", 
-                y="commits",
-                labels={"yearweek": "Week", "commits": "Number of Commits"},
-                title="Weekly Commit Activity"
-            )
-            st.plotly_chart(fig_commits, use_container_width=True)
-            
-            # Top committers
-            st.subheader("Top Committers")
-            top_committers = commits_df['author'].value_counts().head(10).reset_index()
-            top_committers.columns = ['author', 'commits']
-            
-            fig_committers = px.bar(
-                top_committers,
-                x="author",
-                y="commits",
-                labels={"author": "Committer", "commits": "Number of Commits"},
-                title="Top 10 Committers"
-            )
-            st.plotly_chart(fig_committers, use_container_width=True)
-            
-            return commits_df
+        return commits_df
     
     return pd.DataFrame()
\ No newline at end of file
@@ -0,0 +1,220 @@
+import math
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from utils.github_api import PER_PAGE
+from utils.data_processing import summarize_activity
+from utils.quota import plan_comparison
+from components.commits import load_commits
+from components.issues import load_issues
+from components.pulls import load_pull_requests
+
+COMPARISON_METRICS = [
+    ("commits", "Commits"),
+    ("issues", "Issues Opened"),
+    ("closed_issues", "Issues Closed"),
+    ("pull_requests", "Pull Requests Opened"),
+    ("merged_pull_requests", "Pull Requests Merged"),
+    ("median_days_to_close", "Median Days to Close"),
+    ("median_days_to_merge", "Median Days to Merge")
+]
+
+# Section, label and date column of each loaded frame, in the order _load_repo_data returns them
+COVERAGE_COLUMNS = [
+    ("commits", "commits", "date"),
+    ("issues", "issues", "created_at"),
+    ("pulls", "pull requests", "created_at")
+]
+
+def _run_in_parallel(func, items):
+    """
+    Apply a function to each item in worker threads
+    
+    The Streamlit script context is attached to every worker so cached
+    loaders and warnings behave as they do on the main thread.
+    
+    Args:
+        func: Function taking a single item
+        items: List of items
+        
+    Returns:
+        List of results in the order of items
+    """
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(items), initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        return list(executor.map(func, items))
+
+def _load_repo_data(full_repo, token, max_pages):
+    """
+    Load the cached commit, issue and pull request data of a repository
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Dictionary of page caps per paginated section
+        
+    Returns:
+        Tuple of commits, issues and pull requests DataFrames
+    """
+    return (
+        load_commits(full_repo, token, max_pages["commits"]),
+        load_issues(full_repo, token, max_pages["issues"]),
+        load_pull_requests(full_repo, token, max_pages["pulls"])
+    )
+
+def _incomplete_sections(frames, start_date, max_pages):
+    """
+    Find loaded data that may not reach back to a start date
+    
+    A frame is complete if fewer pages than the cap were read and the
+    memory ceiling was not reached. Otherwise its oldest item must be no
+    later than the start date.
+    
+    Args:
+        frames: Tuple of commits, issues and pull requests DataFrames
+        start_date: Start date of a snapshot
+        max_pages: Dictionary of page caps the frames were loaded with
+        
+    Returns:
+        List of labels of the incomplete frames
+    """
+    incomplete = []
+    
+    for df, (section, label, column) in zip(frames, COVERAGE_COLUMNS):
+        hit_limit = df.attrs.get("truncated") or df.attrs.get("items_read", 0) >= max_pages[section] * PER_PAGE
+        if hit_limit and (df.empty or df[column].min() > pd.Timestamp(start_date)):
+            incomplete.append(label)
+    
+    return incomplete
+
+def _format_value(value):
+    """
+    Format a metric value for display
+    
+    Args:
+        value: Integer count or float median, possibly NaN
+        
+    Returns:
+        Display string
+    """
+    if isinstance(value, float):
+        return "n/a" if math.isnan(value) else f"{value:.1f}"
+    return str(value)
+
+def _delta(value, baseline):
+    """
+    Compute the difference between two metric values
+    
+    Args:
+        value: Metric value of the selected snapshot
+        baseline: Metric value of the comparison snapshot
+        
+    Returns:
+        Formatted difference, or None if either value is missing
+    """
+    if isinstance(value, float) or isinstance(baseline, float):
+        if math.isnan(value) or math.isnan(baseline):
+            return None
+        return f"{value - baseline:+.1f}"
+    return f"{value - baseline:+d}"
+
+def display_comparison(full_repo, token, start_date, end_date):
+    """
+    Display two snapshots side by side with deltas
+    
+    The selected repository and date range form the first snapshot. The
+    second defaults to the same repository over the preceding period of
+    equal length. Each repository is loaded once through the cached
+    loaders, so comparing two date ranges costs no extra API calls, and
+    the load is planned against the remaining API quota first.
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        start_date: Start date of the selected snapshot
+        end_date: End date of the selected snapshot
+    """
+    st.subheader("Snapshot Comparison")
+    
+    # Default to the preceding period of the same length
+    period = end_date - start_date
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        compare_repo = st.text_input("Compare With Repository (user/repo)", full_repo)
+    with col2:
+        compare_start = st.date_input("Comparison Start Date", start_date - period - timedelta(days=1))
+    with col3:
+        compare_end = st.date_input("Comparison End Date", start_date - timedelta(days=1))
+    
+    compare_repo = compare_repo.strip().strip("/")
+    if len(compare_repo.split("/")) != 2:
+        st.warning("Please enter the comparison repository as user/repo")
+        return
+    
+    if compare_start > compare_end:
+        st.error("Comparison start date should be before comparison end date")
+        return
+    
+    sides = [(full_repo, start_date, end_date), (compare_repo, compare_start, compare_end)]
+    repos = list(dict.fromkeys(repo for repo, _, _ in sides))
+    
+    # Plan the load against the remaining API quota before fetching anything
+    plan = plan_comparison(repos, token)
+    if plan["exhausted"]:
+        st.error(plan["summary"])
+        return
+    elif plan["degraded"]:
+        st.warning(plan["summary"])
+    else:
+        st.info(plan["summary"])
+    
+    with st.spinner("Loading comparison data..."):
+        # Load each distinct repository once, then aggregate both sides in parallel
+        loaded = dict(zip(repos, _run_in_parallel(lambda repo: _load_repo_data(repo, token, plan["max_pages"][repo]), repos)))
+        summaries = _run_in_parallel(lambda side: summarize_activity(*loaded[side[0]], side[1], side[2]), sides)
+    
+    selected, baseline = summaries
+    columns = st.columns(2)
+    
+    # Deltas against data that does not cover a whole period would be misleading
+    incomplete = [_incomplete_sections(loaded[repo], side_start, plan["max_pages"][repo]) for repo, side_start, _ in sides]
+    show_deltas = not any(incomplete)
+    
+    for (repo, side_start, side_end), summary, side_incomplete, column in zip(sides, summaries, incomplete, columns):
+        with column:
+            st.markdown(f"**{repo}** ({side_start} to {side_end})")
+            
+            if side_incomplete:
+                st.warning(
+                    f"Loaded {', '.join(side_incomplete)} do not reach back to {side_start}, "
+                    "so these counts are incomplete and deltas are hidden."
+                )
+            
+            for key, label in COMPARISON_METRICS:
+                delta = _delta(selected[key], baseline[key]) if summary is selected and show_deltas else None
+                # Shorter close and merge times are an improvement
+                delta_color = "inverse" if key.startswith("median_days") else "normal"
+                st.metric(label, _format_value(summary[key]), delta, delta_color=delta_color)
+            
+            if not summary["weekly_commits"].empty:
+                fig_commits = px.line(
+                    summary["weekly_commits"],
+                    x="yearweek",
+                    y="commits",
+                    labels={"yearweek": "Week", "commits": "Number of Commits"},
+                    title="Weekly Commit Activity"
+                )
+                st.plotly_chart(fig_commits, use_container_width=True)
+            
+            if not summary["top_committers"].empty:
+                fig_committers = px.bar(
+                    summary["top_committers"],
+                    x="author",
+                    y="commits",
+                    labels={"author": "Committer", "commits": "Number of Commits"},
+                    title="Top 10 Committers"
+                )
+                st.plotly_chart(fig_committers, use_container_width=True)
\ No newline at end of file
@@ -1,10 +1,101 @@
+import time
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime
-from utils.github_api import get_paginated_data
+from utils.github_api import iter_paginated_data, DATA_CACHE_TTL, DATA_CACHE_MAX_ENTRIES
+from utils.quota import mark_loaded
+from utils.data_processing import build_dataframe_from_pages, filter_dataframe_by_date_range
 
-def display_issues(full_repo, token, start_date, end_date):
+ISSUE_COLUMNS = {
+    "number": "int64",
+    "title": "object",
+    "state": "category",
+    "created_at": "datetime64[ns]",
+    "user": "category",
+    "closed_at": "datetime64[ns]",
+    "days_to_close": "float64"
+}
+
+def _issue_row(issue):
+    """
+    Reduce a raw issue to a row, or None if it should be skipped
+    
+    Args:
+        issue: Issue data from GitHub API
+        
+    Returns:
+        Dictionary of issue fields, or None for pull requests
+    """
+    # Skip pull requests
+    if "pull_request" in issue:
+        return None
+        
+    created_at = datetime.strptime(issue["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+    
+    issue_dict = {
+        "number": issue["number"],
+        "title": issue["title"],
+        "state": issue["state"],
+        "created_at": created_at,
+        "user": issue["user"]["login"] if "login" in issue["user"] else "Unknown",
+        "closed_at": None,
+        "days_to_close": None
+    }
+    
+    # Calculate time to close if closed
+    if issue["state"] == "closed" and issue["closed_at"]:
+        closed_at = datetime.strptime(issue["closed_at"], "%Y-%m-%dT%H:%M:%SZ")
+        issue_dict["closed_at"] = closed_at
+        issue_dict["days_to_close"] = (closed_at - created_at).days
+    
+    return issue_dict
+
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=DATA_CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_issues(full_repo, token, max_pages):
+    """
+    Load the issues of a repository, cached per repository
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        DataFrame of issue data
+    """
+    issues_url = f"https://api.github.com/repos/{full_repo}/issues"
+    # The base URL should not include query parameters - they're added in iter_paginated_data
+    pages = iter_paginated_data(issues_url, token, max_pages, params="state=all")
+    
+    # Reduce each issue to the needed columns as its page arrives
+    issues_df = build_dataframe_from_pages(pages, _issue_row, ISSUE_COLUMNS)
+    
+    if issues_df.attrs["truncated"]:
+        st.warning("Issue data reached the memory limit, showing only the most recent issues")
+    
+    issues_df.attrs["fetched_at"] = time.time()
+    
+    return issues_df
+
+def load_issues(full_repo, token, max_pages=10):
+    """
+    Load the issues of a repository and record the load for the quota planner
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        DataFrame of issue data
+    """
+    issues_df = _fetch_issues(full_repo, token, max_pages)
+    mark_loaded("issues", full_repo, token, max_pages, issues_df.attrs["fetched_at"])
+    
+    return issues_df
+
+def display_issues(full_repo, token, start_date, end_date, max_pages=10):
     """
     Display issue analysis
     
@@ -13,102 +104,70 @@ def display_issues(full_repo, token, start_date, end_date):
         token: GitHub personal access token
         start_date: Start date for filtering
         end_date: End date for filtering
+        max_pages: Maximum number of pages to fetch
         
     Returns:
         DataFrame of issue data
     """
-    # Fix: Correctly format the URL parameters
-    issues_url = f"https://api.github.com/repos/{full_repo}/issues"
-    # The base URL should not include query parameters - they're added in get_paginated_data
-    issues_data = get_paginated_data(issues_url, token, params="state=all")
+    issues_df = load_issues(full_repo, token, max_pages)
+    
+    # Filter by date range
+    issues_df = filter_dataframe_by_date_range(issues_df, "created_at", start_date, end_date)
     
-    if issues_data:
-        # Prepare issues dataframe
-        issues_list = []
+    if not issues_df.empty:
+        # Issues analysis
+        st.subheader("Issue Analysis")
         
-        for issue in issues_data:
-            # Skip pull requests
-            if "pull_request" in issue:
-                continue
-                
-            created_at = datetime.strptime(issue["created_at"], "%Y-%m-%dT%H:%M:%SZ")
-            
-            # Filter by date range
-            if not (start_date <= created_at.date() <= end_date):
-                continue
-                
-            issue_dict = {
-                "number": issue["number"],
-                "title": issue["title"],
-                "state": issue["state"],
-                "created_at": created_at,
-                "user": issue["user"]["login"] if "login" in issue["user"] else "Unknown"
-            }
-            
-            # Calculate time to close if closed
-            if issue["state"] == "closed" and issue["closed_at"]:
-                closed_at = datetime.strptime(issue["closed_at"], "%Y-%m-%dT%H:%M:%SZ")
-                issue_dict["closed_at"] = closed_at
-                issue_dict["days_to_close"] = (closed_at - created_at).days
-            
-            issues_list.append(issue_dict)
+        # Issue status distribution
+        issue_status = issues_df["state"].value_counts().reset_index()
+        issue_status.columns = ["State", "Count"]
         
-        issues_df = pd.DataFrame(issues_list)
+        fig_issue_status = px.pie(
+            issue_status,
+            values="Count",
+            names="State",
+            title="Issue Status Distribution",
+            color="State",
+            color_discrete_map={"open": "red", "closed": "green"}
+        )
+        st.plotly_chart(fig_issue_status, use_container_width=True)
         
-        if not issues_df.empty:
-            # Issues analysis
-            st.subheader("Issue Analysis")
-            
-            # Issue status distribution
-            issue_status = issues_df["state"].value_counts().reset_index()
-            issue_status.columns = ["State", "Count"]
-            
-            fig_issue_status = px.pie(
-                issue_status,
-                values="Count",
-                names="State",
-                title="Issue Status Distribution",
-                color="State",
-                color_discrete_map={"open": "red", "closed": "green"}
-            )
-            st.plotly_chart(fig_issue_status, use_container_width=True)
-            
-            # Calculate average time to close issues
-            closed_issues = issues_df[issues_df["state"] == "closed"]
-            
-            if not closed_issues.empty and "days_to_close" in closed_issues.columns:
-                avg_days_to_close = closed_issues["days_to_close"].mean()
-                median_days_to_close = closed_issues["days_to_close"].median()
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Average Days to Close", f"{avg_days_to_close:.1f}")
-                with col2:
-                    st.metric("Median Days to Close", f"{median_days_to_close:.1f}")
-                
-                # Distribution of time to close
-                fig_close_time = px.histogram(
-                    closed_issues,
-                    x="days_to_close",
-                    nbins=20,
-                    labels={"days_to_close": "Days to Close", "count": "Number of Issues"},
-                    title="Distribution of Time to Close Issues"
-                )
-                st.plotly_chart(fig_close_time, use_container_width=True)
+        # Calculate average time to close issues
+        closed_issues = issues_df[issues_df["state"] == "closed"]
+        
+        if not closed_issues.empty and "days_to_close" in closed_issues.columns:
+            avg_days_to_close = closed_issues["days_to_close"].mean()
+            median_days_to_close = closed_issues["days_to_close"].median()
             
-            # Issues over time
-            issues_df["month"] = issues_df["created_at"].dt.strftime("%Y-%m")
-            monthly_issues = issues_df.groupby("month").size().reset_index(name="count")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Average Days to Close", f"{avg_days_to_close:.1f}")
+            with col2:
+                st.metric("Median Days to Close", f"{median_days_to_close:.1f}")
             
-            fig_issues_time = px.line(
-                monthly_issues,
-                x="month",
-                y="count",
-                labels={"month": "Month", "count": "Number of Issues"},
-                title="Monthly Issue Creation Trend"
+            # Distribution of time to close
+            fig_close_time = px.histogram(
+                closed_issues,
+                x="days_to_close",
+                nbins=20,
+                labels={"days_to_close": "Days to Close", "count": "Number of Issues"},
+                title="Distribution of Time to Close Issues"
             )
-            st.plotly_chart(fig_issues_time, use_container_width=True)
-            
-            return issues_df
+            st.plotly_chart(fig_close_time, use_container_width=True)
+        
+        # Issues over time
+        issues_df["month"] = issues_df["created_at"].dt.strftime("%Y-%m")
+        monthly_issues = issues_df.groupby("month").size().reset_index(name="count")
+        
+        fig_issues_time = px.line(
+            monthly_issues,
+            x="month",
+            y="count",
+            labels={"month": "Month", "count": "Number of Issues"},
+            title="Monthly Issue Creation Trend"
+        )
+        st.plotly_chart(fig_issues_time, use_container_width=True)
+        
+        return issues_df
     
     return pd.DataFrame()
\ No newline at end of file
@@ -1,11 +1,97 @@
+import time
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-from utils.github_api import get_paginated_data
+from utils.github_api import iter_paginated_data, DATA_CACHE_TTL, DATA_CACHE_MAX_ENTRIES
+from utils.quota import mark_loaded
+from utils.data_processing import build_dataframe_from_pages, filter_dataframe_by_date_range
 
-def display_pull_requests(full_repo, token, start_date, end_date):
+PULL_REQUEST_COLUMNS = {
+    "number": "int64",
+    "title": "object",
+    "state": "category",
+    "created_at": "datetime64[ns]",
+    "user": "category",
+    "merged_at": "datetime64[ns]",
+    "days_to_merge": "float64"
+}
+
+def _pull_request_row(pr):
+    """
+    Reduce a raw pull request to a row
+    
+    Args:
+        pr: Pull request data from GitHub API
+        
+    Returns:
+        Dictionary of pull request fields
+    """
+    created_at = datetime.strptime(pr["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+    
+    pr_dict = {
+        "number": pr["number"],
+        "title": pr["title"],
+        "state": pr["state"],
+        "created_at": created_at,
+        "user": pr["user"]["login"] if "login" in pr["user"] else "Unknown",
+        "merged_at": None,
+        "days_to_merge": None
+    }
+    
+    # Calculate time to merge if merged
+    if pr["merged_at"]:
+        merged_at = datetime.strptime(pr["merged_at"], "%Y-%m-%dT%H:%M:%SZ")
+        pr_dict["merged_at"] = merged_at
+        pr_dict["days_to_merge"] = (merged_at - created_at).days
+    
+    return pr_dict
+
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=DATA_CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_pull_requests(full_repo, token, max_pages):
+    """
+    Load the pull requests of a repository, cached per repository
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        DataFrame of pull request data
+    """
+    pulls_url = f"https://api.github.com/repos/{full_repo}/pulls"
+    pages = iter_paginated_data(pulls_url, token, max_pages, params="state=all")
+    
+    # Reduce each pull request to the needed columns as its page arrives
+    pulls_df = build_dataframe_from_pages(pages, _pull_request_row, PULL_REQUEST_COLUMNS)
+    
+    if pulls_df.attrs["truncated"]:
+        st.warning("Pull request data reached the memory limit, showing only the most recent pull requests")
+    
+    pulls_df.attrs["fetched_at"] = time.time()
+    
+    return pulls_df
+
+def load_pull_requests(full_repo, token, max_pages=10):
+    """
+    Load the pull requests of a repository and record the load for the quota planner
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        DataFrame of pull request data
+    """
+    pulls_df = _fetch_pull_requests(full_repo, token, max_pages)
+    mark_loaded("pulls", full_repo, token, max_pages, pulls_df.attrs["fetched_at"])
+    
+    return pulls_df
+
+def display_pull_requests(full_repo, token, start_date, end_date, max_pages=10):
     """
     Display pull request analysis
     
@@ -14,75 +100,48 @@ def display_pull_requests(full_repo, token, start_date, end_date):
         token: GitHub personal access token
         start_date: Start date for filtering
         end_date: End date for filtering
+        max_pages: Maximum number of pages to fetch
         
     Returns:
         DataFrame of pull request data
     """
-    pulls_url = f"https://api.github.com/repos/{full_repo}/pulls"
-    # Fix: Use the params argument correctly
-    pulls_data = get_paginated_data(pulls_url, token, params="state=all")
+    pulls_df = load_pull_requests(full_repo, token, max_pages)
+    
+    # Filter by date range
+    pulls_df = filter_dataframe_by_date_range(pulls_df, "created_at", start_date, end_date)
     
-    if pulls_data:
-        # Prepare pull requests dataframe
-        pulls_list = []
+    if not pulls_df.empty:
+        # Pull requests analysis
+        st.subheader("Pull Request Analysis")
+        
+        # PR status distribution
+        pr_status = pulls_df["state"].value_counts().reset_index()
+        pr_status.columns = ["State", "Count"]
+        
+        fig_pr_status = px.pie(
+            pr_status,
+            values="Count",
+            names="State",
+            title="Pull Request Status Distribution",
+            color="State",
+            color_discrete_map={"open": "red", "closed": "green"}
+        )
+        st.plotly_chart(fig_pr_status, use_container_width=True)
         
-        for pr in pulls_data:
-            created_at = datetime.strptime(pr["created_at"], "%Y-%m-%dT%H:%M:%SZ")
-            
-            # Filter by date range
-            if not (start_date <= created_at.date() <= end_date):
-                continue
-                
-            pr_dict = {
-                "number": pr["number"],
-                "title": pr["title"],
-                "state": pr["state"],
-                "created_at": created_at,
-                "user": pr["user"]["login"] if "login" in pr["user"] else "Unknown"
-            }
-            
-            # Calculate time to merge if merged
-            if pr["merged_at"]:
-                merged_at = datetime.strptime(pr["merged_at"], "%Y-%m-%dT%H:%M:%SZ")
-                pr_dict["merged_at"] = merged_at
-                pr_dict["days_to_merge"] = (merged_at - created_at).days
-            
-            pulls_list.append(pr_dict)
+        # Top PR contributors
+        top_pr_contributors = pulls_df["user"].value_counts().head(10).reset_index()
+        top_pr_contributors.columns = ["User", "Count"]
         
-        pulls_df = pd.DataFrame(pulls_list)
+        fig_pr_contributors = px.bar(
+            top_pr_contributors,
+            x="User",
+            y="Count",
+            labels={"User": "Contributor", "Count": "Number of PRs"},
+            title="Top 10 Pull Request Contributors"
+        )
+        st.plotly_chart(fig_pr_contributors, use_container_width=True)
         
-        if not pulls_df.empty:
-            # Pull requests analysis
-            st.subheader("Pull Request Analysis")
-            
-            # PR status distribution
-            pr_status = pulls_df["state"].value_counts().reset_index()
-            pr_status.columns = ["State", "Count"]
-            
-            fig_pr_status = px.pie(
-                pr_status,
-                values="Count",
-                names="State",
-                title="Pull Request Status Distribution",
-                color="State",
-                color_discrete_map={"open": "red", "closed": "green"}
-            )
-            st.plotly_chart(fig_pr_status, use_container_width=True)
-            
-            # Top PR contributors
-            top_pr_contributors = pulls_df["user"].value_counts().head(10).reset_index()
-            top_pr_contributors.columns = ["User", "Count"]
-            
-            fig_pr_contributors = px.bar(
-                top_pr_contributors,
-                x="User",
-                y="Count",
-                labels={"User": "Contributor", "Count": "Number of PRs"},
-                title="Top 10 Pull Request Contributors"
-            )
-            st.plotly_chart(fig_pr_contributors, use_container_width=True)
-            
-            return pulls_df
+        return pulls_df
     
     return pd.DataFrame()
 
@@ -1,6 +1,7 @@
 import streamlit as st
 from datetime import datetime, timedelta
-from utils.github_api import make_request
+from utils.github_api import get_owner_repos, GitHubAPIError
+from utils.data_processing import search_names
 
 def render_sidebar():
     """
@@ -11,6 +12,7 @@ def render_sidebar():
         full_repo: Selected repository in format "user/repo"
         start_date: Start date for data filtering
         end_date: End date for data filtering
+        repo_data: Repository statistics from the owner listing, or None
     """
     # Authentication section
     st.sidebar.header("GitHub Authentication")
@@ -22,21 +24,47 @@ def render_sidebar():
     repo_input_method = st.sidebar.radio("Select repository by:", ["User/Org + Repository", "Direct URL"])
     
     full_repo = None
+    repo_data = None
     
     if repo_input_method == "User/Org + Repository":
         user_or_org = st.sidebar.text_input("GitHub Username or Organization")
         
         if user_or_org:
-            # Get user repositories
-            repos_url = f"https://api.github.com/users/{user_or_org}/repos"
-            repos_data = make_request(repos_url, token)
+            # Get user repositories (cached per owner)
+            try:
+                repos_data, pages_fetched, total_pages = get_owner_repos(user_or_org, token)
+            except GitHubAPIError:
+                repos_data, pages_fetched, total_pages = [], 0, 0
             
             if repos_data:
+                repos_by_name = {repo["name"]: repo for repo in repos_data}
                 repo_names = [repo["name"] for repo in repos_data]
-                selected_repo = st.sidebar.selectbox("Select Repository", repo_names)
                 
-                if selected_repo:
-                    full_repo = f"{user_or_org}/{selected_repo}"
+                if pages_fetched < total_pages:
+                    st.sidebar.info(
+                        f"Loaded the {len(repo_names)} most recently pushed repositories "
+                        f"({pages_fetched} of {total_pages} pages) to save API quota."
+                    )
+                
+                # Type-ahead filtering over the cached listing
+                repo_query = st.sidebar.text_input("Search Repositories")
+                matching_repos = search_names(repo_names, repo_query)
+                
+                if matching_repos:
+                    st.sidebar.caption(f"Showing {len(matching_repos)} of {len(repo_names)} repositories")
+                    # Nothing is selected until the user picks, so typing never triggers a load
+                    selected_repo = st.sidebar.selectbox(
+                        "Select Repository",
+                        matching_repos,
+                        index=None,
+                        placeholder="Choose a repository"
+                    )
+                    
+                    if selected_repo:
+                        full_repo = f"{user_or_org}/{selected_repo}"
+                        repo_data = repos_by_name[selected_repo]
+                else:
+                    st.sidebar.warning("No repositories match your search")
             else:
                 st.sidebar.warning("Please enter a valid GitHub username or organization")
     else:  # Direct URL
@@ -84,4 +112,4 @@ def render_sidebar():
     3. Copy and paste it here
     """)
     
-    return token, full_repo, start_date, end_date
\ No newline at end of file
+    return token, full_repo, start_date, end_date, repo_data
\ No newline at end of file
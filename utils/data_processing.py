@@ -1,6 +1,17 @@
+import os
+import sys
+import difflib
+from bisect import bisect_left
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+# Rows buffered as Python dicts before being converted into typed arrays
+DEFAULT_CHUNK_SIZE = 5000
+
+# Ceiling on the typed data of one parsed endpoint before reading stops
+DEFAULT_MAX_MEMORY_MB = int(os.environ.get("DASHBOARD_MAX_MEMORY_MB", "16"))
+
 def filter_by_date_range(data, date_field, start_date, end_date):
     """
     Filter a list of dictionaries by date range
@@ -51,4 +62,235 @@ def convert_to_dataframe(data, fields):
             row[col_name] = value
         result.append(row)
         
-    return pd.DataFrame(result)
\ No newline at end of file
+    return pd.DataFrame(result)
+
+def _rows_to_arrays(rows, columns, category_codes):
+    """
+    Convert buffered rows into one typed array per column
+    
+    Categorical columns are stored as integer codes into a code table
+    shared by all chunks, so chunks never need re-categorizing.
+    
+    Args:
+        rows: List of dictionaries keyed by column name
+        columns: Dictionary mapping column names to pandas dtypes
+        category_codes: Dictionary mapping categorical column names to their code tables
+        
+    Returns:
+        Tuple of a dictionary of arrays per column and their size in bytes
+    """
+    arrays = {}
+    size = 0
+    
+    for col, dtype in columns.items():
+        values = [row[col] for row in rows]
+        
+        if dtype == "category":
+            codes = category_codes[col]
+            array = np.fromiter(
+                (-1 if value is None else codes.setdefault(value, len(codes)) for value in values),
+                dtype=np.int32,
+                count=len(values)
+            )
+        elif dtype == "object":
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            size += sum(sys.getsizeof(value) for value in values)
+        else:
+            array = np.array(values, dtype=dtype)
+        
+        arrays[col] = array
+        size += array.nbytes
+        
+    return arrays, size
+
+def build_dataframe_from_pages(pages, extract_row, columns, chunk_size=DEFAULT_CHUNK_SIZE, max_memory_mb=DEFAULT_MAX_MEMORY_MB):
+    """
+    Build a typed DataFrame from paginated API results with bounded memory
+    
+    Each raw item is reduced to a row as soon as its page arrives, so the
+    raw JSON is never accumulated. Rows are appended to typed column arrays
+    in chunks. Once those arrays and the buffered rows exceed max_memory_mb
+    no further pages are read, and the DataFrame is marked as truncated in
+    its attrs. Since pages arrive newest first, a truncated frame holds the
+    most recent items.
+    
+    Args:
+        pages: Iterable of pages, each a list of raw API items
+        extract_row: Function mapping a raw item to a row dictionary, or None to skip it
+        columns: Dictionary mapping column names to pandas dtypes
+        chunk_size: Number of rows to buffer before converting them to typed arrays
+        max_memory_mb: Memory ceiling for the typed arrays in megabytes
+        
+    Returns:
+        pandas DataFrame with the requested columns. Its attrs hold
+        "items_read", the number of raw items read, and "truncated"
+    """
+    limit_bytes = max_memory_mb * 1024 * 1024
+    category_codes = {col: {} for col, dtype in columns.items() if dtype == "category"}
+    chunks = {col: [] for col in columns}
+    rows = []
+    rows_bytes = 0
+    size = 0
+    items_read = 0
+    truncated = False
+    
+    for page in pages:
+        items_read += len(page)
+        for item in page:
+            row = extract_row(item)
+            if row is not None:
+                rows.append(row)
+                rows_bytes += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+        
+        if len(rows) >= chunk_size:
+            arrays, chunk_bytes = _rows_to_arrays(rows, columns, category_codes)
+            rows = []
+            rows_bytes = 0
+            for col, array in arrays.items():
+                chunks[col].append(array)
+            size += chunk_bytes
+        
+        # Check the ceiling after every page, counting the buffered rows too
+        if size + rows_bytes > limit_bytes:
+            truncated = True
+            break
+    
+    if rows:
+        arrays, _ = _rows_to_arrays(rows, columns, category_codes)
+        for col, array in arrays.items():
+            chunks[col].append(array)
+    
+    # Join one column at a time so only a single column is ever held twice
+    data = {}
+    for col, dtype in columns.items():
+        empty_dtype = np.int32 if dtype == "category" else dtype
+        array = np.concatenate(chunks[col]) if chunks[col] else np.empty(0, dtype=empty_dtype)
+        chunks[col] = None
+        
+        if dtype == "category":
+            array = pd.Categorical.from_codes(array, categories=list(category_codes[col]))
+        data[col] = array
+    
+    df = pd.DataFrame(data, copy=False)
+    df.attrs["items_read"] = items_read
+    df.attrs["truncated"] = truncated
+    
+    return df
+
+def search_names(sorted_names, query, limit=100):
+    """
+    Find names matching a type-ahead query
+    
+    Prefix matches come first, found by binary search on the sorted
+    names, followed by substring matches and then fuzzy matches.
+    
+    Args:
+        sorted_names: List of names sorted case-insensitively
+        query: Text typed by the user
+        limit: Maximum number of names to return
+        
+    Returns:
+        List of matching names
+    """
+    query = query.strip().lower()
+    if not query:
+        return sorted_names[:limit]
+    
+    # Prefix matches form a contiguous run in the sorted names
+    matches = []
+    index = bisect_left(sorted_names, query, key=str.lower)
+    while index < len(sorted_names) and sorted_names[index].lower().startswith(query) and len(matches) < limit:
+        matches.append(sorted_names[index])
+        index += 1
+    
+    # Substring matches
+    if len(matches) < limit:
+        found = set(matches)
+        for name in sorted_names:
+            if name not in found and query in name.lower():
+                matches.append(name)
+                found.add(name)
+                if len(matches) >= limit:
+                    break
+    
+    # Fuzzy matches for typos
+    if len(matches) < limit:
+        lower_to_name = {name.lower(): name for name in sorted_names}
+        close = difflib.get_close_matches(query, list(lower_to_name), n=limit - len(matches), cutoff=0.6)
+        found = set(matches)
+        matches.extend(lower_to_name[name] for name in close if lower_to_name[name] not in found)
+    
+    return matches
+
+def filter_dataframe_by_date_range(df, column, start_date, end_date):
+    """
+    Filter a DataFrame by date range
+    
+    Args:
+        df: pandas DataFrame with a datetime column
+        column: Name of the datetime column
+        start_date: Start date for filtering
+        end_date: End date for filtering (inclusive)
+        
+    Returns:
+        Filtered copy of the DataFrame
+    """
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+    filtered = df[(df[column] >= start) & (df[column] < end)].reset_index(drop=True)
+    
+    # Drop categories that no longer occur so value counts stay meaningful
+    for col in filtered.select_dtypes("category").columns:
+        filtered[col] = filtered[col].cat.remove_unused_categories()
+    
+    return filtered
+
+def weekly_commit_counts(commits_df):
+    """
+    Count commits per ISO week
+    
+    Args:
+        commits_df: DataFrame of commits with a "date" column
+        
+    Returns:
+        DataFrame with "yearweek" and "commits" columns
+    """
+    week = commits_df['date'].dt.isocalendar().week
+    year = commits_df['date'].dt.year
+    yearweek = year.astype(str) + "-" + week.astype(str).str.zfill(2)
+    
+    return yearweek.groupby(yearweek).size().rename_axis('yearweek').reset_index(name='commits')
+
+def summarize_activity(commits_df, issues_df, pulls_df, start_date, end_date):
+    """
+    Aggregate commit, issue and pull request activity for a date range
+    
+    Args:
+        commits_df: DataFrame of commits
+        issues_df: DataFrame of issues
+        pulls_df: DataFrame of pull requests
+        start_date: Start date for filtering
+        end_date: End date for filtering
+        
+    Returns:
+        Dictionary of aggregated metrics
+    """
+    commits = filter_dataframe_by_date_range(commits_df, "date", start_date, end_date)
+    issues = filter_dataframe_by_date_range(issues_df, "created_at", start_date, end_date)
+    pulls = filter_dataframe_by_date_range(pulls_df, "created_at", start_date, end_date)
+    
+    top_committers = commits['author'].value_counts().head(10).reset_index()
+    top_committers.columns = ['author', 'commits']
+    
+    return {
+        "weekly_commits": weekly_commit_counts(commits),
+        "top_committers": top_committers,
+        "commits": len(commits),
+        "issues": len(issues),
+        "closed_issues": int((issues["state"] == "closed").sum()),
+        "pull_requests": len(pulls),
+        "merged_pull_requests": int(pulls["merged_at"].notna().sum()),
+        "median_days_to_close": issues["days_to_close"].median(),
+        "median_days_to_merge": pulls["days_to_merge"].median()
+    }
\ No newline at end of file
@@ -1,10 +1,46 @@
 import requests
 import streamlit as st
 import time
+from urllib.parse import urlparse, parse_qs
 
-def make_request(url, token=None, headers=None, params=None):
+# Seconds an owner's repository listing is reused before being fetched again
+REPO_LIST_CACHE_TTL = 600
+
+# Seconds parsed commits, issues and pull requests are reused before being fetched again
+DATA_CACHE_TTL = 3600
+
+# Parsed frames kept per loader across all sessions. Each frame is bounded by
+# DASHBOARD_MAX_MEMORY_MB, so three loaders hold at most 12 times that ceiling
+DATA_CACHE_MAX_ENTRIES = 4
+
+# Items requested per page by the paginated helpers
+PER_PAGE = 100
+
+# Share of the remaining API quota the repository picker may spend on a listing
+REPO_LIST_QUOTA_SHARE = 0.1
+
+class GitHubAPIError(Exception):
+    """Raised inside cached functions so that failed requests are not cached"""
+
+def _last_page(response):
     """
-    Make a request to the GitHub API with rate limit handling
+    Read the page number of the "last" relation of a response's Link header
+    
+    Args:
+        response: requests.Response of a paginated endpoint
+        
+    Returns:
+        Last page number, or None if the response is the only page
+    """
+    if "last" not in response.links:
+        return None
+    
+    last_query = parse_qs(urlparse(response.links["last"]["url"]).query)
+    return int(last_query["page"][0])
+
+def _get_response(url, token=None, headers=None, params=None):
+    """
+    Send a GET request to the GitHub API, waiting out rate limits
     
     Args:
         url: API endpoint URL
@@ -13,7 +49,7 @@ def make_request(url, token=None, headers=None, params=None):
         params: URL parameters as a string ("param1=value1&param2=value2")
         
     Returns:
-        JSON response or None if error
+        requests.Response
     """
     if headers is None:
         headers = {}
@@ -36,7 +72,24 @@ def make_request(url, token=None, headers=None, params=None):
         wait_time = max(0, reset_time - time.time())
         st.warning(f"Rate limit exceeded. Waiting {wait_time:.1f} seconds for reset...")
         time.sleep(wait_time + 1)
-        return make_request(url, token, headers)
+        return _get_response(url, token, headers)
+        
+    return response
+
+def make_request(url, token=None, headers=None, params=None):
+    """
+    Make a request to the GitHub API with rate limit handling
+    
+    Args:
+        url: API endpoint URL
+        token: GitHub personal access token
+        headers: Additional headers
+        params: URL parameters as a string ("param1=value1&param2=value2")
+        
+    Returns:
+        JSON response or None if error
+    """
+    response = _get_response(url, token, headers, params)
     
     # Handle other errors
     if response.status_code != 200:
@@ -45,25 +98,76 @@ def make_request(url, token=None, headers=None, params=None):
         
     return response.json()
 
-def get_paginated_data(base_url, token=None, max_pages=10, params=None):
+def get_rate_limit(token=None):
     """
-    Get paginated data from GitHub API
+    Get the core API quota, which this request does not count against
+    
+    Args:
+        token: GitHub personal access token
+        
+    Returns:
+        Dictionary with "limit", "remaining" and "reset", or None if error
+    """
+    rate_data = make_request("https://api.github.com/rate_limit", token)
+    
+    if rate_data and "resources" in rate_data:
+        return rate_data["resources"]["core"]
+        
+    return None
+
+@st.cache_data(ttl=DATA_CACHE_TTL, show_spinner=False)
+def count_items(base_url, token=None, params=None):
+    """
+    Count the items of a paginated endpoint with a single cheap probe
+    
+    Requesting one item per page makes the page number of the Link
+    header's "last" relation equal to the total number of items.
     
     Args:
         base_url: Base API URL
         token: GitHub personal access token
-        max_pages: Maximum number of pages to fetch
         params: Additional URL parameters as a string
         
     Returns:
-        List of results
+        Number of items
+        
+    Raises:
+        GitHubAPIError: If the probe fails, so the failure is not cached
+    """
+    probe_params = f"{params}&per_page=1" if params else "per_page=1"
+    response = _get_response(base_url, token, params=probe_params)
+    
+    # Errors are not shown here; the planner assumes the worst case instead
+    if response.status_code != 200:
+        raise GitHubAPIError(f"{response.status_code} - {response.text}")
+    
+    item_count = _last_page(response)
+    if item_count is None:
+        item_count = len(response.json())
+        
+    return item_count
+
+def iter_paginated_data(base_url, token=None, max_pages=10, params=None):
+    """
+    Iterate over paginated data from GitHub API one page at a time
+    
+    Only the current page is held in memory, so callers can reduce each
+    page to the fields they need before the next one is fetched.
+    
+    Args:
+        base_url: Base API URL
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch (None for no limit)
+        params: Additional URL parameters as a string
+        
+    Yields:
+        List of results for each page
     """
-    all_data = []
     page = 1
     
     while True:
         # Build pagination parameter
-        pagination_param = f"page={page}&per_page=100"
+        pagination_param = f"page={page}&per_page={PER_PAGE}"
         
         # Combine with other params if any
         request_params = pagination_param
@@ -75,10 +179,100 @@ def get_paginated_data(base_url, token=None, max_pages=10, params=None):
         if not page_data or len(page_data) == 0:
             break
             
-        all_data.extend(page_data)
+        yield page_data
         page += 1
         
-        if page > max_pages:  # Limit to avoid too many API calls
+        # A short page is the last one, so skip requesting an empty page
+        if len(page_data) < PER_PAGE:
             break
+        
+        if max_pages is not None and page > max_pages:  # Limit to avoid too many API calls
+            break
+
+def get_paginated_data(base_url, token=None, max_pages=10, params=None):
+    """
+    Get paginated data from GitHub API
+    
+    Args:
+        base_url: Base API URL
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        params: Additional URL parameters as a string
+        
+    Returns:
+        List of results
+    """
+    all_data = []
+    
+    for page_data in iter_paginated_data(base_url, token, max_pages, params):
+        all_data.extend(page_data)
             
-    return all_data
\ No newline at end of file
+    return all_data
+
+def _reduce_repos(page_data):
+    """
+    Reduce a page of repositories to the fields used by the sidebar
+    
+    Args:
+        page_data: List of repositories from GitHub API
+        
+    Returns:
+        List of repository dictionaries
+    """
+    return [
+        {
+            "name": repo["name"],
+            "full_name": repo["full_name"],
+            "stargazers_count": repo["stargazers_count"],
+            "forks_count": repo["forks_count"],
+            "open_issues_count": repo["open_issues_count"]
+        }
+        for repo in page_data
+    ]
+
+@st.cache_data(ttl=REPO_LIST_CACHE_TTL, show_spinner=False)
+def get_owner_repos(user_or_org, token=None, max_pages=50):
+    """
+    Get the repositories of a user or organization, cached per owner
+    
+    Each repository is reduced to its name and the statistics shown by
+    display_repo_info, so selecting one needs no further API call. The
+    first page tells how many pages the owner has. Further pages are only
+    fetched within REPO_LIST_QUOTA_SHARE of the remaining quota, most
+    recently pushed repositories first.
+    
+    Args:
+        user_or_org: GitHub username or organization
+        token: GitHub personal access token
+        max_pages: Maximum number of pages to fetch
+        
+    Returns:
+        Tuple of repository dictionaries sorted case-insensitively by name,
+        the number of pages fetched and the number of pages the owner has
+        
+    Raises:
+        GitHubAPIError: If the listing cannot be read, so the failure is not cached
+    """
+    repos_url = f"https://api.github.com/users/{user_or_org}/repos"
+    response = _get_response(repos_url, token, params=f"sort=pushed&page=1&per_page={PER_PAGE}")
+    
+    if response.status_code != 200:
+        raise GitHubAPIError(f"{response.status_code} - {response.text}")
+    
+    repos = _reduce_repos(response.json())
+    total_pages = _last_page(response) or 1
+    
+    # Spend only a share of the remaining quota on the rest of the listing
+    rate = get_rate_limit(token)
+    extra_pages = int(rate["remaining"] * REPO_LIST_QUOTA_SHARE) if rate else 0
+    page_limit = min(total_pages, max_pages, 1 + extra_pages)
+    
+    pages_fetched = 1
+    for page in range(2, page_limit + 1):
+        page_data = make_request(repos_url, token, params=f"sort=pushed&page={page}&per_page={PER_PAGE}")
+        if not page_data:
+            break
+        repos.extend(_reduce_repos(page_data))
+        pages_fetched += 1
+    
+    return sorted(repos, key=lambda repo: repo["name"].lower()), pages_fetched, total_pages
\ No newline at end of file
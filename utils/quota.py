@@ -0,0 +1,437 @@
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from utils.github_api import get_rate_limit, count_items, GitHubAPIError, DATA_CACHE_TTL, DATA_CACHE_MAX_ENTRIES, PER_PAGE
+
+# Page cap used when the quota allows a full load
+DEFAULT_MAX_PAGES = 10
+
+# Paginated sections and the endpoint parameters their loaders use
+PAGINATED_SECTIONS = {
+    "commits": ("commits", None),
+    "issues": ("issues", "state=all"),
+    "pulls": ("pulls", "state=all")
+}
+
+# Sections loaded with a single request
+SINGLE_REQUEST_SECTIONS = ["contributors", "languages"]
+
+# Dashboard sections in display order
+SECTIONS = ["contributors", "commits", "languages", "issues", "pulls"]
+
+# Sections dropped when the quota is short, least valuable first
+SKIP_ORDER = ["pulls", "languages", "issues", "contributors", "commits"]
+
+# Page caps tried before any section is dropped; pages are newest first
+PAGE_CAPS = [DEFAULT_MAX_PAGES, 5, 2, 1]
+
+SECTION_LABELS = {
+    "contributors": "contributors",
+    "commits": "commit history",
+    "languages": "languages",
+    "issues": "issues",
+    "pulls": "pull requests"
+}
+
+# Mirror of the loaders' st.cache_data entries, which all sessions share.
+# Keys are (section, repository, token, page cap), values the fetch time,
+# ordered from least to most recently used
+_loaded_sections = OrderedDict()
+_loaded_sections_lock = threading.Lock()
+
+def mark_loaded(section, full_repo, token, max_pages, fetched_at):
+    """
+    Record a loader call so the planner knows which loads are still cached
+    
+    Entries are evicted least recently used first once a section has more
+    than DATA_CACHE_MAX_ENTRIES, as st.cache_data does for the loader.
+    
+    Args:
+        section: Name of a paginated section
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        max_pages: Page cap the section was loaded with
+        fetched_at: Time the cached data was fetched from the API
+    """
+    key = (section, full_repo, token, max_pages)
+    
+    with _loaded_sections_lock:
+        _loaded_sections[key] = fetched_at
+        _loaded_sections.move_to_end(key)
+        
+        section_keys = [loaded_key for loaded_key in _loaded_sections if loaded_key[0] == section]
+        for evicted_key in section_keys[:-DATA_CACHE_MAX_ENTRIES]:
+            del _loaded_sections[evicted_key]
+
+def _cached_max_pages(section, full_repo, token):
+    """
+    Get the largest page cap a section is still cached with
+    
+    Args:
+        section: Name of a paginated section
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        
+    Returns:
+        Page cap of the cached load, or None if not cached
+    """
+    now = time.time()
+    
+    with _loaded_sections_lock:
+        caps = [
+            max_pages for (loaded_section, repo, loaded_token, max_pages), fetched_at in _loaded_sections.items()
+            if (loaded_section, repo, loaded_token) == (section, full_repo, token) and now - fetched_at < DATA_CACHE_TTL
+        ]
+    
+    return max(caps) if caps else None
+
+def _uses_cache(cached_pages, max_pages):
+    """
+    Check whether a cached load can serve a plan
+    
+    A load cached with a smaller cap than the plan's holds fewer items
+    than the plan allows, so it is fetched again instead.
+    
+    Args:
+        cached_pages: Page cap of the cached load, or None if not cached
+        max_pages: Page cap of the plan
+        
+    Returns:
+        True if the cached load is used
+    """
+    return cached_pages is not None and cached_pages >= max_pages
+
+def _section_pages(cached, max_pages):
+    """
+    Get the page cap each paginated section is loaded with under a plan
+    
+    Args:
+        cached: Dictionary of cached page caps per paginated section
+        max_pages: Page cap of the plan
+        
+    Returns:
+        Dictionary of page caps per paginated section
+    """
+    return {
+        section: cached[section] if _uses_cache(cached[section], max_pages) else max_pages
+        for section in PAGINATED_SECTIONS
+    }
+
+def _reduced(sections, max_pages, item_counts, cached):
+    """
+    Check whether a plan's page cap cuts off items of any section it fetches
+    
+    Args:
+        sections: Sections the plan loads
+        max_pages: Page cap of the plan
+        item_counts: Dictionary of probed item counts per paginated section
+        cached: Dictionary of cached page caps per paginated section
+        
+    Returns:
+        True if some fetched section has more items than the cap allows
+    """
+    return max_pages < DEFAULT_MAX_PAGES and any(
+        not _uses_cache(cached[section], max_pages)
+        and (item_counts.get(section) is None or item_counts[section] > max_pages * PER_PAGE)
+        for section in PAGINATED_SECTIONS if section in sections
+    )
+
+def _sections_to_probe(cached):
+    """
+    Find the paginated sections a cached load cannot fully serve
+    
+    Args:
+        cached: Dictionary of cached page caps per paginated section
+        
+    Returns:
+        List of section names
+    """
+    return [section for section in PAGINATED_SECTIONS if not _uses_cache(cached[section], DEFAULT_MAX_PAGES)]
+
+def _probe_item_counts(to_probe, token, remaining):
+    """
+    Probe the item counts of paginated sections
+    
+    Args:
+        to_probe: List of (repository, section) pairs
+        token: GitHub personal access token
+        remaining: Remaining API quota before probing
+        
+    Returns:
+        Tuple of item counts per (repository, section) pair and the remaining quota after probing
+    """
+    item_counts = {}
+    
+    for repo, section in to_probe:
+        endpoint, params = PAGINATED_SECTIONS[section]
+        try:
+            item_counts[(repo, section)] = count_items(f"https://api.github.com/repos/{repo}/{endpoint}", token, params)
+        except GitHubAPIError:
+            # Unknown counts fall back to the worst case
+            continue
+    
+    # Probes are cached, so read back what they actually cost
+    rate = get_rate_limit(token)
+    return item_counts, rate["remaining"] if rate else remaining - len(to_probe)
+
+def _reset_time(rate):
+    """
+    Format the time the API quota resets
+    
+    Args:
+        rate: Core quota from get_rate_limit
+        
+    Returns:
+        Time as "HH:MM"
+    """
+    return datetime.fromtimestamp(rate["reset"]).strftime("%H:%M")
+
+def _section_cost(section, max_pages, item_counts, cached):
+    """
+    Estimate the number of requests a section will make
+    
+    Pagination stops at the first short page, so a count that is an exact
+    multiple of PER_PAGE costs one more request for the empty page.
+    
+    Args:
+        section: Name of a dashboard section
+        max_pages: Page cap for paginated sections
+        item_counts: Dictionary of probed item counts per paginated section
+        cached: Dictionary of cached page caps per paginated section
+        
+    Returns:
+        Number of requests
+    """
+    if section in SINGLE_REQUEST_SECTIONS:
+        return 1
+    if _uses_cache(cached[section], max_pages):
+        return 0
+    
+    # Unknown item counts assume the worst case
+    items = item_counts.get(section)
+    if items is None:
+        return max_pages
+    return min(items // PER_PAGE + 1, max_pages)
+
+def _cheapest_fit(budget, item_counts, cached):
+    """
+    Find the fullest plan whose cost fits the budget
+    
+    Args:
+        budget: Number of requests available for the sections
+        item_counts: Dictionary of probed item counts per paginated section
+        cached: Dictionary of cached page caps per paginated section
+        
+    Returns:
+        Tuple of skipped sections, sections to load, page cap and cost
+    """
+    # Prefer a smaller page cap over dropping a section
+    for skip_count in range(len(SKIP_ORDER) + 1):
+        skipped = SKIP_ORDER[:skip_count]
+        sections = [section for section in SECTIONS if section not in skipped]
+        
+        for max_pages in PAGE_CAPS:
+            cost = sum(_section_cost(section, max_pages, item_counts, cached) for section in sections)
+            if cost <= budget:
+                return skipped, sections, max_pages, cost
+    
+    return list(SKIP_ORDER), [], PAGE_CAPS[-1], 0
+
+def _fit_rank(fit):
+    """
+    Rank a result of _cheapest_fit, lower being fuller
+    
+    Args:
+        fit: Tuple returned by _cheapest_fit
+        
+    Returns:
+        Tuple of the number of skipped sections and the negated page cap
+    """
+    skipped, _, max_pages, _ = fit
+    return len(skipped), -max_pages
+
+def plan_dashboard(full_repo, token, have_repo_data):
+    """
+    Choose which sections to load so the dashboard fits the remaining API quota
+    
+    Cached sections are free. If the full load does not fit, the page cap
+    of the paginated sections is lowered first, keeping the most recent
+    items, and sections are dropped only if that is not enough. Item
+    counts are probed only when they could lead to a fuller plan than
+    assuming the worst case.
+    
+    Args:
+        full_repo: Repository in format "user/repo"
+        token: GitHub personal access token
+        have_repo_data: Whether repository information is already available
+        
+    Returns:
+        Dictionary with "sections" to load, "max_pages" per paginated
+        section, "skipped" sections, estimated "cost", "remaining" quota,
+        whether the quota is "exhausted", whether the plan is "degraded"
+        and a "summary" of the choice
+    """
+    cached = {section: _cached_max_pages(section, full_repo, token) for section in PAGINATED_SECTIONS}
+    rate = get_rate_limit(token)
+    
+    if rate is None:
+        return {
+            "sections": list(SECTIONS),
+            "max_pages": _section_pages(cached, DEFAULT_MAX_PAGES),
+            "skipped": [],
+            "cost": None,
+            "remaining": None,
+            "exhausted": False,
+            "degraded": False,
+            "summary": "Could not read the API quota, loading all sections."
+        }
+    
+    remaining = rate["remaining"]
+    repo_cost = 0 if have_repo_data else 1
+    item_counts = {}
+    
+    # Probe only if the best case the probes could reveal beats the worst case without them
+    to_probe = _sections_to_probe(cached)
+    worst_case = _cheapest_fit(remaining - repo_cost, {}, cached)
+    best_case = _cheapest_fit(remaining - repo_cost - len(to_probe), {section: 0 for section in to_probe}, cached)
+    if to_probe and _fit_rank(best_case) < _fit_rank(worst_case):
+        probed, remaining = _probe_item_counts([(full_repo, section) for section in to_probe], token, remaining)
+        item_counts = {section: count for (_, section), count in probed.items()}
+    
+    budget = remaining - repo_cost
+    skipped, sections, max_pages, cost = _cheapest_fit(budget, item_counts, cached)
+    
+    if budget < 0 or not sections:
+        return {
+            "sections": [],
+            "max_pages": {},
+            "skipped": list(SECTIONS),
+            "cost": 0,
+            "remaining": remaining,
+            "exhausted": True,
+            "degraded": True,
+            "summary": f"API quota exhausted. It resets at {_reset_time(rate)}."
+        }
+    
+    cost += repo_cost
+    
+    summary = f"Estimated cost: {cost} of {remaining} remaining API requests."
+    cached_sections = [
+        SECTION_LABELS[section] for section in PAGINATED_SECTIONS
+        if section in sections and _uses_cache(cached[section], max_pages)
+    ]
+    if cached_sections:
+        summary += f" Using cached {', '.join(cached_sections)}."
+    
+    reduced = _reduced(sections, max_pages, item_counts, cached)
+    if reduced:
+        summary += f" Loading only the most recent {max_pages * PER_PAGE} items per section to stay within the quota."
+    if skipped:
+        summary += f" Skipping {', '.join(SECTION_LABELS[section] for section in skipped)} to stay within the quota."
+    
+    return {
+        "sections": sections,
+        "max_pages": _section_pages(cached, max_pages),
+        "skipped": list(skipped),
+        "cost": cost,
+        "remaining": remaining,
+        "exhausted": False,
+        "degraded": reduced or bool(skipped),
+        "summary": summary
+    }
+
+def _comparison_fit(budget, repos, item_counts, cached):
+    """
+    Find the largest page cap at which every repository of a comparison fits the budget
+    
+    Args:
+        budget: Number of requests available
+        repos: List of repositories in format "user/repo"
+        item_counts: Dictionary of probed item counts per repository and section
+        cached: Dictionary of cached page caps per repository and section
+        
+    Returns:
+        Tuple of the page cap and cost, or (None, 0) if nothing fits
+    """
+    for max_pages in PAGE_CAPS:
+        cost = sum(
+            _section_cost(section, max_pages, item_counts[repo], cached[repo])
+            for repo in repos for section in PAGINATED_SECTIONS
+        )
+        if cost <= budget:
+            return max_pages, cost
+    
+    return None, 0
+
+def plan_comparison(repos, token):
+    """
+    Choose the page cap for loading every repository of a comparison within the remaining API quota
+    
+    All three paginated sections are needed for each repository, so only
+    the page cap is lowered. If even the smallest cap does not fit, the
+    quota is reported as exhausted.
+    
+    Args:
+        repos: List of distinct repositories in format "user/repo"
+        token: GitHub personal access token
+        
+    Returns:
+        Dictionary with "max_pages" per repository and paginated section,
+        estimated "cost", "remaining" quota, whether the quota is
+        "exhausted", whether the plan is "degraded" and a "summary"
+    """
+    cached = {
+        repo: {section: _cached_max_pages(section, repo, token) for section in PAGINATED_SECTIONS}
+        for repo in repos
+    }
+    rate = get_rate_limit(token)
+    
+    if rate is None:
+        return {
+            "max_pages": {repo: _section_pages(cached[repo], DEFAULT_MAX_PAGES) for repo in repos},
+            "cost": None,
+            "remaining": None,
+            "exhausted": False,
+            "degraded": False,
+            "summary": "Could not read the API quota, loading both snapshots in full."
+        }
+    
+    remaining = rate["remaining"]
+    item_counts = {repo: {} for repo in repos}
+    
+    # Probe only if the best case the probes could reveal beats the worst case without them
+    to_probe = [(repo, section) for repo in repos for section in _sections_to_probe(cached[repo])]
+    worst_cap, _ = _comparison_fit(remaining, repos, item_counts, cached)
+    best_counts = {repo: {section: 0 for probe_repo, section in to_probe if probe_repo == repo} for repo in repos}
+    best_cap, _ = _comparison_fit(remaining - len(to_probe), repos, best_counts, cached)
+    if to_probe and (best_cap or 0) > (worst_cap or 0):
+        probed, remaining = _probe_item_counts(to_probe, token, remaining)
+        for (repo, section), count in probed.items():
+            item_counts[repo][section] = count
+    
+    max_pages, cost = _comparison_fit(remaining, repos, item_counts, cached)
+    
+    if max_pages is None:
+        return {
+            "max_pages": {},
+            "cost": 0,
+            "remaining": remaining,
+            "exhausted": True,
+            "degraded": True,
+            "summary": f"Not enough API quota to load this comparison. It resets at {_reset_time(rate)}."
+        }
+    
+    summary = f"Estimated cost: {cost} of {remaining} remaining API requests."
+    degraded = any(_reduced(list(PAGINATED_SECTIONS), max_pages, item_counts[repo], cached[repo]) for repo in repos)
+    if degraded:
+        summary += f" Loading only the most recent {max_pages * PER_PAGE} items per section to stay within the quota."
+    
+    return {
+        "max_pages": {repo: _section_pages(cached[repo], max_pages) for repo in repos},
+        "cost": cost,
+        "remaining": remaining,
+        "exhausted": False,
+        "degraded": degraded,
+        "summary": summary
+    }
\ No newline at end of file